@@ -4,11 +4,14 @@ scrape_reviews.py
 
 Usage:
     python scrape_reviews.py --company zoho-crm --start 2024-01-01 --end 2024-06-30 --source g2
+    python scrape_reviews.py --companies zoho-crm,hubspot --start 2024-01-01 --end 2024-06-30 --source g2
 
 Notes:
 - company should match the product slug used by the site (e.g. "zoho-crm" for G2 URL
   https://www.g2.com/products/zoho-crm/reviews). If unsure, check the product page URL manually.
 - This script uses Playwright to load pages (handles JS-rendered content).
+  If httpx and selectolax are installed, server-rendered pages are fetched over plain
+  HTTP first and the browser is only used when that yields no reviews.
 - Make sure to run: pip install -r requirements.txt
   and then: playwright install
 """
@@ -16,29 +19,119 @@ Notes:
 import argparse
 import asyncio
 import json
+import re
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Awaitable, Callable, Dict, Iterable, Iterator, List, Optional
 
 from dateutil import parser as dateparser
 from playwright.async_api import async_playwright, Page, TimeoutError as PWTimeoutError
 
+# Optional fast path: plain HTTP fetch + C-based HTML parsing, skipping the browser
+try:
+    import httpx
+    try:
+        from selectolax.lexbor import LexborHTMLParser as HTMLParser
+    except ImportError:
+        # selectolax < 0.3 only ships the Modest backend (deprecated in 1.0)
+        from selectolax.parser import HTMLParser
+except ImportError:
+    httpx = None
+    HTMLParser = None
+
+try:
+    import h2  # noqa: F401  (httpx needs it for http2=True; plain HTTP/1.1 otherwise)
+    HTTP2 = True
+except ImportError:
+    HTTP2 = False
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 # -----------------------
 # Helpers
 # -----------------------
-def parse_date_safe(date_str: str) -> Optional[datetime]:
+# call a parser instance directly, skipping the parserinfo dispatch in dateparser.parse()
+_DU_PARSER = dateparser.parser()
+
+@lru_cache(maxsize=4096)
+def _parse_cached(date_str: str) -> Optional[datetime]:
+    # Results are made naive (keeping the stamp's own wall-clock time) so they compare with
+    # the naive --start/--end; e.g. '2024-01-05T10:00Z' would otherwise be offset-aware.
+    try:
+        # fast path: ISO strings (e.g. <time datetime="...">)
+        return datetime.fromisoformat(date_str[:19].replace('Z', '+00:00')).replace(tzinfo=None)
+    except ValueError:
+        pass
     try:
-        return dateparser.parse(date_str, dayfirst=False)
+        return _DU_PARSER.parse(date_str, dayfirst=False).replace(tzinfo=None)
     except Exception:
         return None
 
+def parse_date_safe(date_str: str) -> Optional[datetime]:
+    # review dates repeat heavily ("2 months ago", same ISO days), so memoize the parse
+    return _parse_cached(date_str) if date_str else None
+
 def within_range(dt: datetime, start: datetime, end: datetime) -> bool:
     return start <= dt <= end
 
 def iso(d: datetime) -> str:
     return d.strftime("%Y-%m-%d")
 
+# numbers are bounded on both sides so '45/5' or '4.5 out of 50' don't yield a partial match
+_RATING_RE = re.compile(r'(?<![\d.,])(\d+(?:[.,]\d+)?)\s*(?:/|out of)\s*5(?:[.,]0+)?(?![.,]?\d)', re.IGNORECASE)
+_STARS_RATING_RE = re.compile(r'(?<![\d.,])(\d+(?:[.,]\d+)?)\s*stars?\b', re.IGNORECASE)
+_BARE_RATING_RE = re.compile(r'\s*(\d+(?:[.,]\d+)?)\s*')
+
+def parse_rating(text: str) -> Optional[float]:
+    """
+    '4.5 out of 5 stars' / '4.5/5.0' / '4,5 out of 5' / 'Rated 4.5 stars' / '4.5' -> 4.5.
+    None if no rating can be read or it is outside the 0-5 scale.
+    """
+    if not text:
+        return None
+    m = _RATING_RE.search(text) or _STARS_RATING_RE.search(text) or _BARE_RATING_RE.fullmatch(text)
+    if not m:
+        return None
+    value = float(m.group(1).replace(',', '.'))
+    return value if value <= 5 else None
+
+def review_key(title: str, body: str) -> int:
+    """Integer dedupe key for a review (title + start of body)."""
+    s = title + '|' + body[:120]
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(s.encode("utf-8"))
+    return hash(s)
+
+def _dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+def write_reviews_json(reviews: Iterable[Dict], outpath: Path) -> int:
+    """
+    Stream reviews to outpath as a JSON array, one record per line, without building the
+    whole document in memory. Returns the number of reviews written.
+    """
+    count = 0
+    with open(outpath, "wb") as f:
+        f.write(b"[")
+        for r in reviews:
+            f.write(b",\n  " if count else b"\n  ")
+            f.write(_dumps(r))
+            count += 1
+        f.write(b"\n]\n" if count else b"]\n")
+    return count
+
 # -----------------------
 # Generic extraction strategy
 # -----------------------
@@ -49,26 +142,85 @@ def iso(d: datetime) -> str:
 #
 # You may need to tweak CSS selectors for particular product pages in the future.
 
+# review-shaped nodes; shared by the in-page extractor, the scroll wait and the HTML path
+REVIEW_CANDIDATE_SELECTOR = ('[class*="review" i], [data-testid*="review" i], [aria-label*="review" i], '
+                             'article[class*="card"], li[class*="review"]')
+
+# field order of the rows returned by the in-page extractor
+REVIEW_FIELDS = ('title', 'description', 'date', 'rating', 'reviewer', '_k')
+
 async def extract_reviews_from_dom(page: Page) -> List[Dict]:
-    """Run in-page JS to find likely review nodes and extract fields robustly."""
+    """
+    Run in-page JS to find likely review nodes and extract fields robustly.
+    Processed nodes are tagged and their keys remembered in the page, so each call
+    returns only reviews not seen by a previous call.
+    """
     script = """
-    () => {
+    (candidateSel) => {
         const candidates = [];
-        // A broad query to find anything that looks like a review card
-        const nodes = Array.from(document.querySelectorAll('[class*="review"], [data-testid*="review"], [aria-label*="review"], article, div'));
+        // field selectors, defined once rather than as literals inside the per-card loop
+        const titleSel = 'h1, h2, h3, .review-title, [class*="title"]';
+        const bodySel = '.review-text, .review-body, [class*="comment"], [class*="content"], p';
+        const blockSel = 'p, div';
+        const dateSel = '[class*="date"], [class*="posted"]';
+        const ratingSel = '[aria-label*="star"], [class*="rating"], [class*="stars"]';
+        const reviewerSel = '[class*="author"], [class*="user"], [class*="reviewer"]';
+        const dateRe = /\\b\\d{4}-\\d{2}-\\d{2}\\b/;
+        const relRe = /\\b\\d{1,2}\\s+(days|months|years)\\b/;
+        // Review-shaped nodes only (REVIEW_CANDIDATE_SELECTOR). Every match is marked data-seen
+        // so the scroll wait can tell when new nodes arrive; those already processed as
+        // candidates on a previous call (tagged data-scraped) are skipped.
+        const matched = Array.from(document.querySelectorAll(candidateSel));
+        for (const n of matched) if (!n.hasAttribute('data-seen')) n.setAttribute('data-seen', '1');
+        const nodes = matched.filter(n => !n.hasAttribute('data-scraped'));
         for (const n of nodes) {
             // we only want nodes that contain some review-like text and a date-like token
-            const txt = n.innerText || "";
+            // (textContent avoids the layout flush innerText forces on every node)
+            // cheap length check first; only survivors pay for lowercasing and regex tests
+            const txt = n.textContent || "";
             if (txt.length < 50) continue;  // skip tiny nodes
             // heuristic: presence of 'review' words, star, out of 5, or 'posted' etc
             const low = txt.toLowerCase();
-            if (!(low.includes("review") || low.includes("stars") || low.match(/\\b\\d{4,4}-\\d{2}-\\d{2}\\b/) || low.match(/\\b\\d{1,2}\\s+(days|months|years)\\b/))) continue;
+            if (!(low.includes("review") || low.includes("stars") || dateRe.test(low) || relRe.test(low))) continue;
             candidates.push(n);
         }
+        // Candidates are often nested (a card holds review-ish parts; a list holds cards).
+        // A candidate is a list if at least two of the outermost candidates inside it are
+        // complete reviews (title, body and a date or rating of their own); a card's
+        // header/body parts aren't. Lists and anything holding one are dropped, then only the
+        // outermost remaining candidates are kept so each card's sub-nodes are queried once.
+        // A one-card list is kept as the record: querySelector still reaches the card's fields.
+        // (Same rule as _collapse_nested on the HTML path.)
+        const looksLikeReview = (n) => !!(n.querySelector(titleSel) && n.querySelector(bodySel) &&
+            (n.querySelector('time') || n.querySelector(dateSel) || n.querySelector(ratingSel)));
+        const within = (c) => candidates.filter(o => o !== c && c.contains(o));
+        const isList = (c) => {
+            const inner = within(c);
+            const top = inner.filter(o => !inner.some(p => p !== o && p.contains(o)));
+            return top.filter(looksLikeReview).length >= 2;
+        };
+        const lists = candidates.filter(isList);
+        const nonWrappers = candidates.filter(c => !lists.some(l => c.contains(l)));
+        const cards = nonWrappers.filter(c => !nonWrappers.some(o => o !== c && o.contains(c)));
+        // tag everything we looked at so wrappers and card parts aren't reconsidered next call
+        for (const c of candidates) c.setAttribute('data-scraped', '1');
         // Map candidate nodes to extracted fields
         const results = [];
-        const seen = new Set();
-        for (const c of candidates) {
+        // keys persist on window so dedupe holds across page.evaluate calls
+        const seen = window.__seenReviewKeys || (window.__seenReviewKeys = new Set());
+        // 53-bit string hash (cyrb53): numeric keys are cheaper to store and compare than strings
+        const hashKey = (str) => {
+            let h1 = 0xdeadbeef, h2 = 0x41c6ce57;
+            for (let i = 0; i < str.length; i++) {
+                const ch = str.charCodeAt(i);
+                h1 = Math.imul(h1 ^ ch, 2654435761);
+                h2 = Math.imul(h2 ^ ch, 1597334677);
+            }
+            h1 = Math.imul(h1 ^ (h1 >>> 16), 2246822507) ^ Math.imul(h2 ^ (h2 >>> 13), 3266489909);
+            h2 = Math.imul(h2 ^ (h2 >>> 16), 2246822507) ^ Math.imul(h1 ^ (h1 >>> 13), 3266489909);
+            return 4294967296 * (2097151 & h2) + (h1 >>> 0);
+        };
+        for (const c of cards) {
             let title = "";
             let body = "";
             let date = "";
@@ -76,162 +228,431 @@ async def extract_reviews_from_dom(page: Page) -> List[Dict]:
             let reviewer = "";
 
             // title heuristics
-            const h = c.querySelector('h1, h2, h3, .review-title, [class*="title"]');
+            const h = c.querySelector(titleSel);
             if (h) title = h.innerText.trim();
 
             // body heuristics
-            const bodyNode = c.querySelector('.review-text, .review-body, [class*="comment"], [class*="content"], p');
+            const bodyNode = c.querySelector(bodySel);
             if (bodyNode) body = bodyNode.innerText.trim();
             else {
-                // fallback: full text minus first line
-                const all = c.innerText.trim().split('\\n').map(s=>s.trim()).filter(Boolean);
+                // fallback: text of the leaf blocks minus the first one
+                // (textContent on the container's blocks, never innerText on the container itself)
+                const all = Array.from(c.querySelectorAll(blockSel))
+                    .filter(e => !e.querySelector(blockSel))
+                    .map(e => e.textContent.trim()).filter(Boolean);
                 if (all.length >= 2) {
                     body = all.slice(1).join(" ");
                     if (!title) title = all[0];
                 } else {
-                    body = c.innerText.trim();
+                    body = c.textContent.replace(/\\s+/g, " ").trim();
                 }
             }
 
             // date heuristics: look for time elements or date-like text
-            const t = c.querySelector('time') || c.querySelector('[class*="date"], [class*="posted"]');
-            if (t) date = t.getAttribute('datetime') || t.innerText.trim();
+            const t = c.querySelector('time') || c.querySelector(dateSel);
+            if (t) date = t.getAttribute('datetime') || t.textContent.trim();
 
             // rating heuristics: look for stars or aria-labels
-            const r = c.querySelector('[aria-label*="star"], [class*="rating"], [class*="stars"]');
-            if (r) rating = r.getAttribute('aria-label') || r.innerText.trim();
+            const r = c.querySelector(ratingSel);
+            if (r) rating = r.getAttribute('aria-label') || r.textContent.trim();
 
             // reviewer heuristics
-            const rev = c.querySelector('[class*="author"], [class*="user"], [class*="reviewer"]');
-            if (rev) reviewer = rev.innerText.trim();
+            const rev = c.querySelector(reviewerSel);
+            if (rev) reviewer = rev.textContent.trim();
 
             // unique id for deduplication
-            const key = (title + '|' + body.slice(0,80)).slice(0,200);
+            const key = hashKey(title + '|' + body.slice(0,120));
             if (seen.has(key)) continue;
             seen.add(key);
 
-            results.push({
-                'title': title,
-                'description': body,
-                'date': date,
-                'rating': rating,
-                'reviewer': reviewer
-            });
+            // positional, in REVIEW_FIELDS order: no repeated key names in the bridge payload
+            results.push([title, body, date, rating, reviewer, key]);
         }
         return results;
     }
     """
     try:
-        extracted = await page.evaluate(script)
-        return extracted or []
+        extracted = await page.evaluate(script, REVIEW_CANDIDATE_SELECTOR)
+        return [dict(zip(REVIEW_FIELDS, r)) for r in extracted or []]
     except Exception as e:
         print("DOM extraction error:", e)
         return []
 
+# -----------------------
+# HTTP fast path (server-rendered pages, no browser)
+# -----------------------
+HTTP_HEADERS = {
+    "User-Agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                   "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"),
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+_ISO_DATE_RE = re.compile(r"\b\d{4}-\d{2}-\d{2}\b")
+_REL_DATE_RE = re.compile(r"\b\d{1,2}\s+(days|months|years)\b")
+
+HTML_TITLE_SELECTOR = 'h1, h2, h3, .review-title, [class*="title"]'
+HTML_BODY_SELECTOR = '.review-text, .review-body, [class*="comment"], [class*="content"], p'
+HTML_DATE_SELECTOR = '[class*="date"], [class*="posted"]'
+HTML_RATING_SELECTOR = '[aria-label*="star"], [class*="rating"], [class*="stars"]'
+HTML_REVIEWER_SELECTOR = '[class*="author"], [class*="user"], [class*="reviewer"]'
+
+def _query(node, selector: str):
+    """First descendant matching selector, like DOM querySelector (selectolax's css_first can
+    return the node itself)."""
+    for sub in node.css(selector):
+        if sub.mem_id != node.mem_id:
+            return sub
+    return None
+
+def _node_text(node, selector: str) -> str:
+    sub = _query(node, selector)
+    return sub.text(separator=" ", strip=True) if sub else ""
+
+def _date_node(node):
+    return _query(node, 'time') or _query(node, HTML_DATE_SELECTOR)
+
+def _looks_like_review(node) -> bool:
+    """A self-contained review has a title, a body and a date or rating of its own."""
+    return bool(_query(node, HTML_TITLE_SELECTOR) and _query(node, HTML_BODY_SELECTOR)
+                and (_date_node(node) or _query(node, HTML_RATING_SELECTOR)))
+
+def _collapse_nested(candidates: List) -> List:
+    """
+    Collapse nested candidates to one node per review card. A candidate is a list wrapper if
+    at least two of the outermost candidates inside it are complete reviews, or if it holds
+    such a list (section > list > cards); wrappers are dropped, then only the outermost remaining candidate is kept, so a card's review-ish parts
+    (header, body) don't become records of their own.
+    """
+    ancestors = {}
+    for c in candidates:
+        ids = set()
+        p = c.parent
+        while p is not None:
+            ids.add(p.mem_id)
+            p = p.parent
+        ancestors[c.mem_id] = ids
+
+    def contains(outer, inner) -> bool:
+        return outer.mem_id in ancestors[inner.mem_id]
+
+    def is_list(c) -> bool:
+        inner = [o for o in candidates if contains(c, o)]
+        top = [o for o in inner if not any(contains(p, o) for p in inner)]
+        return sum(1 for o in top if _looks_like_review(o)) >= 2
+
+    lists = [c for c in candidates if is_list(c)]
+    non_wrappers = [c for c in candidates
+                    if not any(l.mem_id == c.mem_id or contains(c, l) for l in lists)]
+    return [c for c in non_wrappers if not any(contains(o, c) for o in non_wrappers)]
+
+def extract_reviews_from_html(html: str) -> List[Dict]:
+    """
+    Same heuristics as extract_reviews_from_dom, applied to static HTML with selectolax.
+    Returns [] unless at least one review carries a date, so pages that merely mention
+    reviews (e.g. search results) fall through to the browser path.
+    """
+    candidates = []
+    seen_nodes = set()
+    for c in HTMLParser(html).css(REVIEW_CANDIDATE_SELECTOR):
+        if c.mem_id in seen_nodes:
+            continue
+        seen_nodes.add(c.mem_id)
+        txt = c.text(separator=" ", strip=True)
+        if len(txt) < 50:
+            continue
+        low = txt.lower()
+        if not ("review" in low or "stars" in low or _ISO_DATE_RE.search(low) or _REL_DATE_RE.search(low)):
+            continue
+        candidates.append(c)
+
+    results = []
+    seen = set()
+    for c in _collapse_nested(candidates):
+        title = _node_text(c, HTML_TITLE_SELECTOR)
+        body = _node_text(c, HTML_BODY_SELECTOR)
+
+        date = ""
+        t = _date_node(c)
+        if t:
+            date = t.attributes.get("datetime") or t.text(strip=True)
+
+        if not body:
+            if not date:
+                # neither a body element nor a date: not plausibly a review
+                continue
+            # fallback: full text minus first line
+            lines = [l.strip() for l in c.text(separator="\n").split("\n") if l.strip()]
+            if len(lines) >= 2:
+                body = " ".join(lines[1:])
+                if not title:
+                    title = lines[0]
+            else:
+                body = c.text(separator=" ", strip=True)
+
+        rating = ""
+        r = _query(c, HTML_RATING_SELECTOR)
+        if r:
+            rating = r.attributes.get("aria-label") or r.text(strip=True)
+
+        reviewer = _node_text(c, HTML_REVIEWER_SELECTOR)
+
+        key = review_key(title, body)
+        if key in seen:
+            continue
+        seen.add(key)
+        results.append({
+            'title': title,
+            'description': body,
+            'date': date,
+            'rating': rating,
+            'reviewer': reviewer,
+            '_k': key
+        })
+    if not any(r['date'] for r in results):
+        return []
+    return results
+
+def _http_client():
+    return httpx.AsyncClient(http2=HTTP2, timeout=20, headers=HTTP_HEADERS, follow_redirects=True)
+
+async def _get_html(client, url: str) -> str:
+    try:
+        resp = await client.get(url)
+        resp.raise_for_status()
+    except Exception as e:
+        print("HTTP fetch error:", e)
+        return ""
+    return resp.text
+
+_MORE_PAGES_SELECTOR = 'a[rel="next"], link[rel="next"], [class*="paginat" i], [class*="pager" i]'
+_MORE_BUTTON_RE = re.compile(r"(load|show|see) more( reviews)?|next( page)?|[›»>]", re.IGNORECASE)
+
+def _has_more_pages(html: str) -> bool:
+    """True if the page links to further reviews (pagination, rel=next, a Load more / Next control)."""
+    tree = HTMLParser(html)
+    if tree.css_first(_MORE_PAGES_SELECTOR):
+        return True
+    return any(_MORE_BUTTON_RE.fullmatch(n.text(strip=True)) for n in tree.css('button, a'))
+
+async def fetch_reviews_http(url: str, client=None, single_page: bool = False,
+                             sem: Optional[asyncio.Semaphore] = None) -> List[Dict]:
+    """
+    Fetch a page over plain HTTP and extract reviews from the returned HTML.
+    Returns [] if the optional deps are missing, the request fails, or nothing is found,
+    so callers can fall back to the Playwright path. With single_page=True it also returns []
+    when the page has pagination or a Load more control, since only the browser flow
+    follows those; callers without their own pagination use this so they don't silently
+    stop at page one. If sem is given the request is made while holding it.
+    """
+    if httpx is None:
+        return []
+    if client is None:
+        try:
+            async with _http_client() as client:
+                return await fetch_reviews_http(url, client, single_page, sem)
+        except Exception as e:
+            print("HTTP client error:", e)
+            return []
+    if sem is not None:
+        async with sem:
+            html = await _get_html(client, url)
+    else:
+        html = await _get_html(client, url)
+    if not html:
+        return []
+    reviews = extract_reviews_from_html(html)
+    if reviews and single_page and _has_more_pages(html):
+        print("More reviews behind pagination; using the browser for", url)
+        return []
+    return reviews
+
+_PAGE_PARAM_RE = re.compile(r"[?&]page=(\d+)")
+_PAGINATION_LINK_SELECTOR = ('[class*="paginat" i] a[href], [class*="pager" i] a[href], nav a[href], '
+                             'a[rel="next"], link[rel="next"]')
+
+def _page_count(html: str) -> Optional[int]:
+    """
+    Highest ?page=N linked from the pagination markup, or None if there is none. Windowed
+    paginators ("1 2 3 4 5 ... Next") only show a lower bound, so callers keep probing past it.
+    """
+    pages = []
+    for a in HTMLParser(html).css(_PAGINATION_LINK_SELECTOR):
+        m = _PAGE_PARAM_RE.search(a.attributes.get("href") or "")
+        if m:
+            pages.append(int(m.group(1)))
+    return max(pages) if pages else None
+
+async def collect_paginated(base_url: str, max_pages: int = 20, concurrency: int = 8,
+                            sem: Optional[asyncio.Semaphore] = None) -> List[Dict]:
+    """
+    Fetch ?page=1..N concurrently over HTTP. Pages up to the highest one linked from page 1's
+    pagination are fetched at once; past that (or without pagination links) pages are probed
+    in batches until one comes back empty or max_pages is reached.
+    At most `concurrency` requests are in flight, or pass a shared sem to cap several
+    concurrent calls (e.g. one per company) together.
+    """
+    if httpx is None:
+        return []
+    if sem is None:
+        sem = asyncio.Semaphore(concurrency)
+
+    try:
+        async with _http_client() as client:
+            async def fetch(i: int) -> List[Dict]:
+                return await fetch_reviews_http(f"{base_url}?page={i}", client, sem=sem)
+
+            async with sem:
+                html = await _get_html(client, f"{base_url}?page=1")
+            first = extract_reviews_from_html(html) if html else []
+            if not first:
+                return []
+            pages = [first]
+
+            nxt = 2
+            last = _page_count(html)
+            if last is not None and last >= 2:
+                top = min(last, max_pages)
+                pages += await asyncio.gather(*[fetch(i) for i in range(2, top + 1)])
+                # the linked page was empty: that really was the end
+                nxt = top + 1 if pages[-1] else max_pages + 1
+            while nxt <= max_pages:
+                batch = await asyncio.gather(*[fetch(i) for i in range(nxt, min(nxt + concurrency, max_pages + 1))])
+                pages += batch
+                if not all(batch):
+                    break
+                nxt += concurrency
+    except Exception as e:
+        print("HTTP client error:", e)
+        return []
+
+    # sites that ignore ?page= serve the same reviews again; drop those
+    collected = []
+    seen = set()
+    for found in pages:
+        for r in found:
+            if r['_k'] not in seen:
+                seen.add(r['_k'])
+                collected.append(r)
+    return collected
+
+def _normalize_and_filter(reviews: Iterable[Dict], start: datetime, end: datetime, source: str) -> Iterator[Dict]:
+    """
+    Single pass over raw extracted reviews: parse each date once, drop reviews dated outside
+    [start, end] (reviews with unparseable dates are kept), and yield the output record shape.
+    Lazy, so each review goes through every stage before the next and the normalized set
+    is never held in memory as a whole; it is consumed by write_reviews_json.
+    """
+    for r in reviews:
+        # try the date field first, then a date token at the start of the description
+        dt = parse_date_safe(r.get('date') or "") or parse_date_safe((r.get('description') or "")[:50])
+        if dt is not None and not within_range(dt, start, end):
+            continue
+        yield {
+            "title": r.get("title") or "",
+            "description": r.get("description") or "",
+            "date": iso(dt) if dt else (r.get("date") or ""),
+            "rating": parse_rating(r.get("rating") or ""),
+            "reviewer": r.get("reviewer") or "",
+            "source": source
+        }
+
 # -----------------------
 # Site-specific flows (uses same extraction but site navigation/pagination differs)
 # -----------------------
+# Each flow tries the HTTP fast path first and only calls get_page() -- which starts the
+# browser on first use -- when that finds nothing. Flows return a lazy iterator of
+# normalized reviews, meant to be streamed straight to the output file.
+PageFactory = Callable[[], Awaitable[Page]]
+
+# true once the page has review-shaped nodes the extractor hasn't looked at yet
+UNSEEN_REVIEW_NODES_JS = "(sel) => Array.from(document.querySelectorAll(sel)).some(n => !n.hasAttribute('data-seen'))"
 
-async def scroll_and_collect(page: Page, max_scrolls: int = 40, wait_ms: int = 800) -> List[Dict]:
+async def wait_for_new_reviews(page: Page, timeout: int = 3000, grace_ms: int = 800) -> bool:
+    """
+    Wait until review-shaped nodes the extractor hasn't seen appear, instead of sleeping a
+    fixed time. On timeout, pauses grace_ms (for slow renders the check can't see, e.g.
+    content filled into existing nodes) and returns False.
+    """
+    try:
+        await page.wait_for_function(UNSEEN_REVIEW_NODES_JS, arg=REVIEW_CANDIDATE_SELECTOR, timeout=timeout)
+        return True
+    except Exception:
+        # timed out, or a late navigation destroyed the context the check was running in
+        await page.wait_for_timeout(grace_ms)
+        return False
+
+def _strip_fragment(url: str) -> str:
+    return url.split('#', 1)[0]
+
+async def scroll_and_collect(page: Page, max_scrolls: int = 40, wait_ms: int = 800,
+                             timeout_ms: int = 3000) -> List[Dict]:
     """
     Repeatedly scrolls the page to load more reviews (useful for infinite scroll or lazy load),
-    and extracts reviews from DOM after each scroll. Stops early if no new reviews appear.
+    and extracts reviews from DOM after each scroll. After each scroll/click it waits for new
+    review nodes (or, if a "Next" link navigated, for the new page to load) for up to
+    timeout_ms; if nothing shows up it pauses wait_ms before extracting again.
+    Stops early if no new reviews appear.
     """
     collected = []
+    # The in-page dedupe resets when "Next" navigates to a new document, so keep our own
+    # set of the integer keys the extractor returns.
     seen_keys = set()
-    last_len = 0
+    # built once; Playwright re-resolves the locator lazily on each use
+    load_more = page.locator('button:has-text("Load more"), button:has-text("Load More"), a:has-text("Next")').first
 
     for i in range(max_scrolls):
-        # extract current DOM reviews
-        found = await extract_reviews_from_dom(page)
+        # extract reviews added to the DOM since the last call
         new_count = 0
-        for r in found:
-            key = (r.get('title','') + '|' + (r.get('description','') or "")[:120])
-            if key not in seen_keys:
+        for r in await extract_reviews_from_dom(page):
+            if r['_k'] not in seen_keys:
+                seen_keys.add(r['_k'])
                 collected.append(r)
-                seen_keys.add(key)
                 new_count += 1
+        if new_count == 0:
+            # no progress since the last scroll -> stop without another scroll/wait
+            break
 
+        url_before = _strip_fragment(page.url)
         # attempt to click "Load more" buttons if present
         try:
-            load_more = await page.query_selector('button:has-text("Load more"), button:has-text("Load More"), a:has-text("Next"), a:has-text("next")')
-            if load_more:
+            if await load_more.count():
                 try:
-                    await load_more.click()
-                    await page.wait_for_timeout(wait_ms)
+                    await load_more.click(timeout=1000)
                 except Exception:
                     # might be not clickable; fallback to scroll
-                    await page.evaluate("window.scrollBy(0, document.body.scrollHeight);")
-                    await page.wait_for_timeout(wait_ms)
+                    await page.mouse.wheel(0, 20000)
             else:
                 # no button found: scroll
-                await page.evaluate("window.scrollBy(0, document.body.scrollHeight);")
-                await page.wait_for_timeout(wait_ms)
+                await page.mouse.wheel(0, 20000)
         except PWTimeoutError:
-            await page.wait_for_timeout(wait_ms)
-
-        if len(collected) == last_len and new_count == 0:
-            # no progress this iteration -> stop
-            break
-        last_len = len(collected)
+            pass
+        if _strip_fragment(page.url) != url_before:
+            # "Next" navigated to a new document: wait for it to load rather than for new nodes
+            try:
+                await page.wait_for_load_state("domcontentloaded", timeout=timeout_ms)
+            except PWTimeoutError:
+                pass
+        await wait_for_new_reviews(page, timeout=timeout_ms, grace_ms=wait_ms)
 
     return collected
 
-async def scrape_g2(page: Page, company_slug: str, start: datetime, end: datetime) -> List[Dict]:
+async def scrape_g2(get_page: PageFactory, company_slug: str, start: datetime, end: datetime,
+                    http_sem: Optional[asyncio.Semaphore] = None) -> Iterator[Dict]:
     url = f"https://www.g2.com/products/{company_slug}/reviews"
-    print("Opening G2:", url)
-    try:
-        await page.goto(url, timeout=30000)
-    except Exception as e:
-        raise RuntimeError(f"Could not open G2 page: {e}")
-
-    all_reviews = await scroll_and_collect(page)
-
-    # parse/normalize dates, filter by date range
-    normalized = []
-    for r in all_reviews:
-        # try to find date in r['date'] or within description
-        date_candidate = r.get('date') or ""
-        if not date_candidate:
-            # try to find a date token in description
-            # leave as empty for now
-            pass
-        dt = parse_date_safe(date_candidate) or parse_date_safe(r.get('description','')[:50])
-        if dt is None:
-            # if we cannot parse date, keep the review but mark date as unknown
-            r_parsed_date = None
-        else:
-            r_parsed_date = dt
-
-        if r_parsed_date is None or within_range(r_parsed_date, start, end):
-            # include if date unknown (optionally) or within range
-            # For stricter behavior, skip unknown-date reviews:
-            # if r_parsed_date is None: continue
-            r_copy = {
-                "title": r.get("title") or "",
-                "description": r.get("description") or "",
-                "date": iso(r_parsed_date) if r_parsed_date else (r.get("date") or ""),
-                "rating": r.get("rating") or "",
-                "reviewer": r.get("reviewer") or "",
-                "source": "G2"
-            }
-            normalized.append(r_copy)
-
-    # final filter to ensure dates in range if we parsed them
-    filtered = []
-    for r in normalized:
-        if r.get("date"):
-            p = parse_date_safe(r["date"])
-            if p and within_range(p, start, end):
-                filtered.append(r)
-            elif not p:
-                # keep unknown string-dates (conservative)
-                filtered.append(r)
-        else:
-            filtered.append(r)
-    return filtered
-
-async def scrape_capterra(page: Page, company_slug: str, start: datetime, end: datetime) -> List[Dict]:
+    all_reviews = await collect_paginated(url, sem=http_sem)
+    if not all_reviews:
+        # nothing server-rendered: load the page in the browser
+        print("Opening G2:", url)
+        page = await get_page()
+        try:
+            await page.goto(url, timeout=30000)
+        except Exception as e:
+            raise RuntimeError(f"Could not open G2 page: {e}")
+        all_reviews = await scroll_and_collect(page)
+    return _normalize_and_filter(all_reviews, start, end, "G2")
+
+async def scrape_capterra(get_page: PageFactory, company_slug: str, start: datetime, end: datetime,
+                          http_sem: Optional[asyncio.Semaphore] = None) -> Iterator[Dict]:
     # Capterra product pages often look like:
     # https://www.capterra.com/p/12345/product-name/reviews/
     # But many use search-based slugs. We attempt a naive slug URL and fall back to search.
@@ -240,125 +661,239 @@ async def scrape_capterra(page: Page, company_slug: str, start: datetime, end: d
         f"https://www.capterra.com/search?q={company_slug}",
         f"https://www.capterra.com/p/{company_slug}/"
     ]
-    success = False
+    all_reviews = []
     for u in url_variants:
-        try:
-            print("Trying Capterra URL:", u)
-            await page.goto(u, timeout=20000)
-            success = True
+        all_reviews = await fetch_reviews_http(u, single_page=True, sem=http_sem)
+        if all_reviews:
             break
-        except Exception:
-            success = False
-            continue
-    if not success:
-        raise RuntimeError("Could not open Capterra page for provided slug. Please verify company slug.")
-
-    all_reviews = await scroll_and_collect(page)
-
-    normalized = []
-    for r in all_reviews:
-        dt = parse_date_safe(r.get('date') or "")
-        r_copy = {
-            "title": r.get("title") or "",
-            "description": r.get("description") or "",
-            "date": iso(dt) if dt else (r.get("date") or ""),
-            "rating": r.get("rating") or "",
-            "reviewer": r.get("reviewer") or "",
-            "source": "Capterra"
-        }
-        # filter if date parsed and out of range
-        if dt:
-            if within_range(dt, start, end):
-                normalized.append(r_copy)
-        else:
-            # keep if date unknown (optionally)
-            normalized.append(r_copy)
-    return normalized
 
-async def scrape_trustradius(page: Page, company_slug: str, start: datetime, end: datetime) -> List[Dict]:
+    if not all_reviews:
+        page = await get_page()
+        success = False
+        for u in url_variants:
+            try:
+                print("Trying Capterra URL:", u)
+                await page.goto(u, timeout=20000)
+                success = True
+                break
+            except Exception:
+                success = False
+                continue
+        if not success:
+            raise RuntimeError("Could not open Capterra page for provided slug. Please verify company slug.")
+
+        all_reviews = await scroll_and_collect(page)
+    return _normalize_and_filter(all_reviews, start, end, "Capterra")
+
+async def scrape_trustradius(get_page: PageFactory, company_slug: str, start: datetime, end: datetime,
+                             http_sem: Optional[asyncio.Semaphore] = None) -> Iterator[Dict]:
     url = f"https://www.trustradius.com/products/{company_slug}/reviews"
-    print("Opening TrustRadius:", url)
-    try:
-        await page.goto(url, timeout=30000)
-    except Exception as e:
-        raise RuntimeError(f"Could not open TrustRadius page: {e}")
-
-    all_reviews = await scroll_and_collect(page)
-    normalized = []
-    for r in all_reviews:
-        dt = parse_date_safe(r.get('date') or "")
-        r_copy = {
-            "title": r.get("title") or "",
-            "description": r.get("description") or "",
-            "date": iso(dt) if dt else (r.get("date") or ""),
-            "rating": r.get("rating") or "",
-            "reviewer": r.get("reviewer") or "",
-            "source": "TrustRadius"
-        }
-        if dt:
-            if within_range(dt, start, end):
-                normalized.append(r_copy)
-        else:
-            normalized.append(r_copy)
-    return normalized
+    all_reviews = await fetch_reviews_http(url, single_page=True, sem=http_sem)
+    if not all_reviews:
+        print("Opening TrustRadius:", url)
+        page = await get_page()
+        try:
+            await page.goto(url, timeout=30000)
+        except Exception as e:
+            raise RuntimeError(f"Could not open TrustRadius page: {e}")
+        all_reviews = await scroll_and_collect(page)
+    return _normalize_and_filter(all_reviews, start, end, "TrustRadius")
 
 # -----------------------
 # Orchestrator
 # -----------------------
-async def run_scraper(company: str, start_date: str, end_date: str, source: str, outdir: str = "."):
+# Reviews are text; skip downloading/rendering images, fonts, media and stylesheets.
+# Matched by URL so only these requests are routed -- everything else goes straight to the
+# network without a round trip through Python. (Any route disables Playwright's HTTP cache.)
+BLOCKED_RESOURCE_RE = re.compile(
+    r"\.(png|jpe?g|gif|webp|avif|svg|ico|woff2?|ttf|otf|eot|mp4|webm|mp3|css)(\?|#|$)", re.IGNORECASE)
+
+async def _abort_route(route):
+    await route.abort()
+
+class Scraper:
+    """
+    Owns one Playwright instance, browser and context so that several scrapes (sources or
+    companies) share a single browser startup. The browser is launched lazily, the first time
+    a scrape falls back from HTTP to Playwright, so HTTP-only runs never start Chromium.
+    If storage_state is a path, cookies/local storage are loaded from it at launch (when it
+    exists) and saved back on close; the HTTP cache itself is not persisted across runs.
+    block_resources aborts image/font/media/stylesheet URLs, which also turns off the
+    browser's HTTP cache within the run; pass False to keep caching instead.
+    http_concurrency caps the HTTP fast-path requests in flight across all scrapes together,
+    since concurrent companies usually hit the same host.
+    """
+
+    def __init__(self, headless: bool = True, storage_state: Optional[str] = None,
+                 block_resources: bool = True, http_concurrency: int = 8):
+        self.headless = headless
+        self.storage_state = storage_state
+        self.block_resources = block_resources
+        self.playwright = None
+        self.browser = None
+        self.context = None
+        self._lock = asyncio.Lock()
+        self.http_sem = asyncio.Semaphore(http_concurrency)
+
+    async def start(self):
+        """Launch the browser now (scrapes otherwise do it on demand)."""
+        async with self._lock:
+            if self.context is None:
+                self.playwright = await async_playwright().start()
+                self.browser = await self.playwright.chromium.launch(headless=self.headless)
+                state = self.storage_state if self.storage_state and Path(self.storage_state).exists() else None
+                self.context = await self.browser.new_context(storage_state=state)
+                if self.block_resources:
+                    await self.context.route(BLOCKED_RESOURCE_RE, _abort_route)
+        return self
+
+    async def close(self):
+        try:
+            if self.context and self.storage_state:
+                await self.context.storage_state(path=self.storage_state)
+        finally:
+            # tear down even if saving the state failed
+            if self.context:
+                await self.context.close()
+            if self.browser:
+                await self.browser.close()
+            if self.playwright:
+                await self.playwright.stop()
+            self.playwright = self.browser = self.context = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def scrape(self, company: str, start: datetime, end: datetime, source: str) -> Iterator[Dict]:
+        page = None
+
+        async def get_page() -> Page:
+            nonlocal page
+            if page is None:
+                await self.start()
+                page = await self.context.new_page()
+            return page
+
+        try:
+            source_lower = source.lower()
+            if source_lower == "g2":
+                return await scrape_g2(get_page, company, start, end, self.http_sem)
+            elif source_lower == "capterra":
+                return await scrape_capterra(get_page, company, start, end, self.http_sem)
+            elif source_lower in ("trustradius", "trust radius", "trust-radius"):
+                return await scrape_trustradius(get_page, company, start, end, self.http_sem)
+            else:
+                raise ValueError("Unsupported source. Choose 'g2', 'capterra' or 'trustradius'.")
+        finally:
+            if page is not None:
+                await page.close()
+
+def _parse_range(start_date: str, end_date: str):
     # validate dates
     try:
-        start = dateparser.parse(start_date)
-        end = dateparser.parse(end_date)
+        start = datetime.strptime(start_date, "%Y-%m-%d")
+        end = datetime.strptime(end_date, "%Y-%m-%d")
     except Exception as e:
         raise ValueError(f"Invalid date(s): {e}")
     if start > end:
         raise ValueError("Start date must be <= end date.")
+    return start, end
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context()
-        page = await context.new_page()
-
-        source_lower = source.lower()
-        if source_lower == "g2":
-            reviews = await scrape_g2(page, company, start, end)
-        elif source_lower == "capterra":
-            reviews = await scrape_capterra(page, company, start, end)
-        elif source_lower in ("trustradius", "trust radius", "trust-radius"):
-            reviews = await scrape_trustradius(page, company, start, end)
-        else:
-            raise ValueError("Unsupported source. Choose 'g2', 'capterra' or 'trustradius'.")
-
-        # close browser
-        await context.close()
-        await browser.close()
-
-    # Save JSON
+def _output_path(company: str, source: str, start: datetime, end: datetime, outdir: str = ".") -> Path:
     outdir_p = Path(outdir)
     outdir_p.mkdir(parents=True, exist_ok=True)
-    fname = f"{company}_{source_lower}_{start.strftime('%Y%m%d')}_to_{end.strftime('%Y%m%d')}.json"
-    outpath = outdir_p / fname
-    with open(outpath, "w", encoding="utf-8") as f:
-        json.dump(reviews, f, ensure_ascii=False, indent=2)
-
+    fname = f"{company}_{source.lower()}_{start.strftime('%Y%m%d')}_to_{end.strftime('%Y%m%d')}.json"
+    return outdir_p / fname
+
+def save_reviews(reviews: List[Dict], company: str, source: str, start: datetime, end: datetime,
+                 outdir: str = ".") -> Path:
+    """Write reviews to the per-company JSON file and return its path."""
+    outpath = _output_path(company, source, start, end, outdir)
+    write_reviews_json(reviews, outpath)
     print(f"Saved {len(reviews)} reviews to {outpath}")
-    return outpath, reviews
+    return outpath
+
+async def _scrape_and_save(scraper: "Scraper", company: str, start: datetime, end: datetime, source: str,
+                           outdir: str, stream: bool):
+    reviews = await scraper.scrape(company, start, end, source)
+    if not stream:
+        reviews = list(reviews)
+        return save_reviews(reviews, company, source, start, end, outdir), reviews
+    # write straight from the normalization generator; the normalized set is never held in memory
+    outpath = _output_path(company, source, start, end, outdir)
+    count = write_reviews_json(reviews, outpath)
+    print(f"Saved {count} reviews to {outpath}")
+    return outpath, count
+
+async def run_scraper(company: str, start_date: str, end_date: str, source: str, outdir: str = ".",
+                      storage_state: Optional[str] = None, stream: bool = False):
+    """
+    Scrape one company and write its JSON file. Returns (outpath, reviews). With stream=True
+    reviews are written as they are normalized, without building the list, and the second
+    element is the number of reviews written instead.
+    """
+    company = company.strip()
+    if not company:
+        raise ValueError("No company slug given.")
+    start, end = _parse_range(start_date, end_date)
+
+    async with Scraper(storage_state=storage_state) as scraper:
+        return await _scrape_and_save(scraper, company, start, end, source, outdir, stream)
+
+async def run_scrapers(companies: List[str], start_date: str, end_date: str, source: str, outdir: str = ".",
+                       storage_state: Optional[str] = None, concurrency: int = 4, stream: bool = False) -> Dict:
+    """
+    Scrape several companies concurrently (at most `concurrency` pages at once) in one shared
+    browser, writing one JSON file per company. Returns {company: (outpath, reviews)} -- or
+    (outpath, count) with stream=True, as in run_scraper -- with the exception in place of the
+    tuple for companies that failed. Repeated slugs are scraped once.
+    """
+    companies = list(dict.fromkeys(c.strip() for c in companies if c and c.strip()))
+    if not companies:
+        raise ValueError("No company slugs given.")
+    start, end = _parse_range(start_date, end_date)
+    sem = asyncio.Semaphore(concurrency)
+
+    async with Scraper(storage_state=storage_state) as scraper:
+        async def scrape_one(company: str):
+            async with sem:
+                return await _scrape_and_save(scraper, company, start, end, source, outdir, stream)
+
+        results = await asyncio.gather(*[scrape_one(c) for c in companies], return_exceptions=True)
+    return dict(zip(companies, results))
 
 # -----------------------
 # CLI
 # -----------------------
 def main():
     parser = argparse.ArgumentParser(description="Scrape product reviews from G2 / Capterra / TrustRadius")
-    parser.add_argument("--company", required=True, help="Company product slug (as used in the site's URL)")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--company", help="Company product slug (as used in the site's URL)")
+    target.add_argument("--companies", help="Comma-separated product slugs, scraped concurrently")
     parser.add_argument("--start", required=True, help="Start date (YYYY-MM-DD)")
     parser.add_argument("--end", required=True, help="End date (YYYY-MM-DD)")
     parser.add_argument("--source", required=True, choices=["g2","capterra","trustradius"], help="Source: g2 | capterra | trustradius")
     parser.add_argument("--outdir", default=".", help="Output directory for JSON")
+    parser.add_argument("--storage-state", default=None,
+                        help="Optional JSON file to load/save browser cookies and storage across runs")
     args = parser.parse_args()
 
     try:
-        outpath, reviews = asyncio.run(run_scraper(args.company, args.start, args.end, args.source, args.outdir))
+        if args.company is not None:
+            asyncio.run(run_scraper(args.company, args.start, args.end, args.source, args.outdir,
+                                    args.storage_state, stream=True))
+        else:
+            companies = args.companies.split(",")
+            results = asyncio.run(run_scrapers(companies, args.start, args.end, args.source, args.outdir,
+                                               args.storage_state, stream=True))
+            failed = {c: r for c, r in results.items() if isinstance(r, BaseException)}
+            for c, e in failed.items():
+                print(f"Error ({c}):", e)
+            if failed:
+                sys.exit(1)
     except Exception as e:
         print("Error:", e)
         sys.exit(1)